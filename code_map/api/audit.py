@@ -13,7 +13,12 @@ from typing import AsyncGenerator
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
 
-from ..exceptions import RunNotFoundError, EventNotFoundError, InternalError
+from ..exceptions import (
+    EventNotFoundError,
+    InternalError,
+    RunNotFoundError,
+    ValidationError,
+)
 from ..audit import (
     AuditEvent,
     AuditRun,
@@ -183,6 +188,9 @@ async def append_audit_event(
         )
     except LookupError as exc:
         raise EventNotFoundError(str(exc)) from exc
+    except ValueError as exc:
+        # Oversized payloads are rejected by the storage layer
+        raise ValidationError(str(exc)) from exc
     except Exception as exc:  # pragma: no cover - defensive
         raise InternalError() from exc
     return _serialize_event(event)
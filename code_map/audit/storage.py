@@ -11,17 +11,38 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping, Optional
 
 from sqlmodel import select, desc, func, or_
-from sqlalchemy import select as sa_select
+from sqlalchemy import bindparam, select as sa_select
 
 from ..database import get_engine, init_db, Session
 from ..database_async import get_async_session, init_async_db
 from ..models import AuditRunDB, AuditEventDB
 
 DEFAULT_EVENTS_LIMIT = 200
+MAX_PAYLOAD_BYTES = 256 * 1024
+_UTC = timezone.utc
+
+# Point lookups are built once with bound parameters so each call reuses the
+# same statement (and SQLAlchemy's compiled-SQL cache entry) instead of
+# constructing a fresh select().
+_EVENT_BY_ID = select(AuditEventDB).where(
+    AuditEventDB.id == bindparam("event_id"),
+    AuditEventDB.run_id == bindparam("run_id"),
+)
+_RUN_EVENT_COUNT = select(func.count(AuditEventDB.id)).where(
+    AuditEventDB.run_id == bindparam("run_id")
+)
+_EVENT_BY_ID_ASYNC = sa_select(AuditEventDB).where(
+    AuditEventDB.id == bindparam("event_id"),
+    AuditEventDB.run_id == bindparam("run_id"),
+)
+_RUN_EVENT_COUNT_ASYNC = sa_select(func.count(AuditEventDB.id)).where(
+    AuditEventDB.run_id == bindparam("run_id")
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -55,10 +76,30 @@ class AuditEvent:
     created_at: datetime
 
 
+@lru_cache(maxsize=1024)
+def _normalize_absolute_root(root_str: str) -> str:
+    # Only absolute inputs are cached: relative and "~" paths depend on the
+    # current directory and HOME, so their resolution can change
+    return Path(root_str).resolve().as_posix()
+
+
 def _normalize_root(root: Optional[Path | str]) -> Optional[str]:
     if root is None:
         return None
-    return Path(root).expanduser().resolve().as_posix()
+    root_str = str(root)
+    if Path(root_str).is_absolute():
+        return _normalize_absolute_root(root_str)
+    return Path(root_str).expanduser().resolve().as_posix()
+
+
+def _encode_payload(payload: Optional[Mapping[str, Any]]) -> Optional[str]:
+    """Serializes an event payload, rejecting oversized ones before persisting."""
+    if not payload:
+        return None
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    if len(raw.encode("utf-8")) > MAX_PAYLOAD_BYTES:
+        raise ValueError(f"payload exceeds {MAX_PAYLOAD_BYTES} bytes")
+    return raw
 
 
 def _parse_payload(raw: str | None) -> Optional[dict[str, Any]]:
@@ -88,7 +129,7 @@ def create_run(
             name=name,
             status="open",
             root_path=normalized_root,
-            created_at=datetime.now(timezone.utc),
+            created_at=datetime.now(_UTC),
             notes=notes,
         )
         session.add(run)
@@ -117,7 +158,7 @@ def close_run(
             return None
 
         run.status = status
-        run.closed_at = datetime.now(timezone.utc)
+        run.closed_at = datetime.now(_UTC)
         if notes:
             run.notes = notes
 
@@ -139,7 +180,7 @@ def get_run(run_id: int) -> Optional[AuditRun]:
 
         # Count events
         event_count = session.exec(
-            select(func.count(AuditEventDB.id)).where(AuditEventDB.run_id == run_id)
+            _RUN_EVENT_COUNT, params={"run_id": run_id}
         ).one()
 
         return AuditRun(
@@ -182,7 +223,7 @@ def list_runs(
         results = []
         for run in runs:
             event_count = session.exec(
-                select(func.count(AuditEventDB.id)).where(AuditEventDB.run_id == run.id)
+                _RUN_EVENT_COUNT, params={"run_id": run.id}
             ).one()
 
             results.append(
@@ -220,11 +261,7 @@ def append_event(
     if get_run(run_id) is None:
         raise LookupError(f"Run {run_id} not found")
 
-    payload_json = (
-        json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-        if payload
-        else None
-    )
+    payload_json = _encode_payload(payload)
 
     with Session(engine) as session:
         event = AuditEventDB(
@@ -237,7 +274,7 @@ def append_event(
             status=status,
             ref=ref,
             payload=payload_json,
-            created_at=datetime.now(timezone.utc),
+            created_at=datetime.now(_UTC),
         )
         session.add(event)
         session.commit()
@@ -256,9 +293,7 @@ def get_event(run_id: int, event_id: int) -> Optional[AuditEvent]:
 
     with Session(engine) as session:
         event = session.exec(
-            select(AuditEventDB).where(
-                AuditEventDB.id == event_id, AuditEventDB.run_id == run_id
-            )
+            _EVENT_BY_ID, params={"event_id": event_id, "run_id": run_id}
         ).first()
 
         if not event:
@@ -338,7 +373,7 @@ async def create_run_async(
             name=name,
             status="open",
             root_path=normalized_root,
-            created_at=datetime.now(timezone.utc),
+            created_at=datetime.now(_UTC),
             notes=notes,
         )
         session.add(run)
@@ -369,7 +404,7 @@ async def close_run_async(
             return None
 
         run.status = status
-        run.closed_at = datetime.now(timezone.utc)
+        run.closed_at = datetime.now(_UTC)
         if notes:
             run.notes = notes
 
@@ -388,9 +423,7 @@ async def get_run_async(run_id: int) -> Optional[AuditRun]:
             return None
 
         # Count events using SQLAlchemy select
-        result = await session.execute(
-            sa_select(func.count(AuditEventDB.id)).where(AuditEventDB.run_id == run_id)
-        )
+        result = await session.execute(_RUN_EVENT_COUNT_ASYNC, {"run_id": run_id})
         event_count = result.scalar() or 0
 
         return AuditRun(
@@ -433,9 +466,7 @@ async def list_runs_async(
         for run in runs:
             # Count events for each run
             count_result = await session.execute(
-                sa_select(func.count(AuditEventDB.id)).where(
-                    AuditEventDB.run_id == run.id
-                )
+                _RUN_EVENT_COUNT_ASYNC, {"run_id": run.id}
             )
             event_count = count_result.scalar() or 0
 
@@ -475,11 +506,7 @@ async def append_event_async(
     if run is None:
         raise LookupError(f"Run {run_id} not found")
 
-    payload_json = (
-        json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-        if payload
-        else None
-    )
+    payload_json = _encode_payload(payload)
 
     async with get_async_session() as session:
         event = AuditEventDB(
@@ -492,7 +519,7 @@ async def append_event_async(
             status=status,
             ref=ref,
             payload=payload_json,
-            created_at=datetime.now(timezone.utc),
+            created_at=datetime.now(_UTC),
         )
         session.add(event)
         await session.flush()
@@ -512,10 +539,7 @@ async def get_event_async(run_id: int, event_id: int) -> Optional[AuditEvent]:
 
     async with get_async_session() as session:
         result = await session.execute(
-            sa_select(AuditEventDB).where(
-                AuditEventDB.id == event_id,
-                AuditEventDB.run_id == run_id,
-            )
+            _EVENT_BY_ID_ASYNC, {"event_id": event_id, "run_id": run_id}
         )
         event = result.scalar_one_or_none()
 
@@ -34,9 +34,33 @@ def get_engine(db_path: Path | None = None) -> Engine:
     return create_engine(sqlite_url, connect_args={"check_same_thread": False})
 
 
+# Database URLs whose schema has already been created in this process
+_INITIALIZED_URLS: set[str] = set()
+
+
 def init_db(engine: Engine) -> None:
-    """Initialize the database schema."""
+    """Initialize the database schema.
+
+    ``create_all`` reflects every table, so it only runs once per database
+    URL; later calls (e.g. from storage read paths) return immediately,
+    unless the SQLite file has been deleted since.
+    """
+    url = str(engine.url)
+    if url in _INITIALIZED_URLS:
+        database = engine.url.database
+        if not database or database == ":memory:" or Path(database).exists():
+            return
     SQLModel.metadata.create_all(engine)
+    _INITIALIZED_URLS.add(url)
+
+
+def reset_db_initialized() -> None:
+    """Forget which databases already have their schema.
+
+    Call when engines are reset or disposed (or a database file is
+    replaced) so the next init_db creates any missing tables again.
+    """
+    _INITIALIZED_URLS.clear()
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -22,11 +22,12 @@ from sqlalchemy.ext.asyncio import (
 from sqlmodel import SQLModel
 
 from .constants import META_DIR_NAME
-from .database import DB_FILENAME, ENV_DB_PATH
+from .database import DB_FILENAME, ENV_DB_PATH, reset_db_initialized
 
 # Singleton instances for connection pooling
 _async_engine: AsyncEngine | None = None
 _async_session_factory: async_sessionmaker[AsyncSession] | None = None
+_async_db_initialized = False
 
 
 def get_db_path() -> Path:
@@ -66,13 +67,24 @@ def get_async_engine(db_path: Path | None = None) -> AsyncEngine:
 async def init_async_db(engine: AsyncEngine | None = None) -> None:
     """Initialize the database schema asynchronously.
 
+    The schema of the singleton engine is only created once (normally from
+    the application startup); later calls return without touching the DB.
+
     Args:
         engine: Optional engine to use. If not provided, uses the singleton.
     """
+    global _async_db_initialized
+
+    if engine is None and _async_db_initialized:
+        return
+
     eng = engine or get_async_engine()
     async with eng.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
+    if engine is None or engine is _async_engine:
+        _async_db_initialized = True
+
 
 def get_async_session_factory(
     engine: AsyncEngine | None = None,
@@ -125,12 +137,14 @@ async def close_async_engine() -> None:
 
     Call this during application shutdown to clean up resources.
     """
-    global _async_engine, _async_session_factory
+    global _async_engine, _async_session_factory, _async_db_initialized
 
     if _async_engine is not None:
         await _async_engine.dispose()
         _async_engine = None
         _async_session_factory = None
+        _async_db_initialized = False
+        reset_db_initialized()
 
 
 def reset_async_engine() -> None:
@@ -139,6 +153,8 @@ def reset_async_engine() -> None:
     This synchronously clears the engine reference without disposing.
     Use close_async_engine() for proper cleanup.
     """
-    global _async_engine, _async_session_factory
+    global _async_engine, _async_session_factory, _async_db_initialized
     _async_engine = None
     _async_session_factory = None
+    _async_db_initialized = False
+    reset_db_initialized()
@@ -130,6 +130,11 @@ OPTIONAL_DEPENDENCIES: Tuple[DependencySpec, ...] = (
         modules=("bs4",),
         description="Extracción de elementos HTML",
     ),
+    DependencySpec(
+        key="orjson",
+        modules=("orjson",),
+        description="Serialización JSON acelerada de grafos",
+    ),
 )
 
 optional_dependencies = OptionalDependencyRegistry(OPTIONAL_DEPENDENCIES)
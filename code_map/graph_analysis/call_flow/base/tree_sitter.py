@@ -9,10 +9,72 @@ This mixin eliminates code duplication across Python, TypeScript, and C++ extrac
 from __future__ import annotations
 
 import logging
-from typing import Any, Iterator, Optional
+import threading
+import warnings
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# One parser per (thread, language); tree-sitter parsers are not thread-safe
+_thread_parsers = threading.local()
+
+
+@lru_cache(maxsize=None)
+def load_language(name: str) -> Optional[Tuple[Any, Any]]:
+    """
+    Load a tree-sitter grammar once per process.
+
+    Args:
+        name: tree-sitter language name (e.g. "cpp").
+
+    Returns:
+        Tuple of (Parser class, Language), or None if tree-sitter is missing.
+    """
+    from code_map.dependencies import optional_dependencies
+
+    modules = optional_dependencies.load("tree_sitter_languages")
+    if not modules:
+        return None
+
+    parser_cls = getattr(modules.get("tree_sitter"), "Parser", None)
+    get_language = getattr(modules.get("tree_sitter_languages"), "get_language", None)
+    if parser_cls is None or get_language is None:
+        return None
+
+    # Suppress FutureWarning from tree-sitter
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=FutureWarning)
+        language = get_language(name)
+
+    return parser_cls, language
+
+
+def get_thread_parser(name: str) -> Optional[Any]:
+    """
+    Get the calling thread's parser for a language, creating it on first use.
+
+    Args:
+        name: tree-sitter language name.
+
+    Returns:
+        A Parser bound to the language, or None if it is unavailable.
+    """
+    parsers: Optional[Dict[str, Any]] = getattr(_thread_parsers, "by_language", None)
+    if parsers is None:
+        parsers = _thread_parsers.by_language = {}
+
+    parser = parsers.get(name)
+    if parser is None:
+        loaded = load_language(name)
+        if loaded is None:
+            return None
+        parser_cls, language = loaded
+        parser = parser_cls()
+        parser.set_language(language)
+        parsers[name] = parser
+    return parser
+
 
 class TreeSitterMixin:
     """
@@ -29,6 +91,9 @@ class TreeSitterMixin:
 
             def __init__(self):
                 super().__init__()  # Initializes _parser, _available
+
+    The grammar is loaded once per process and, unless a subclass assigns its
+    own parser, ``_parser`` resolves to a parser owned by the calling thread.
     """
 
     # Subclasses should override with their tree-sitter language name
@@ -36,9 +101,24 @@ class TreeSitterMixin:
 
     def __init__(self) -> None:
         """Initialize mixin state."""
-        self._parser: Optional[Any] = None
+        self._own_parser: Optional[Any] = None
         self._available: Optional[bool] = None
 
+    @property
+    def _parser(self) -> Optional[Any]:
+        """Parser for this extractor's language in the calling thread."""
+        if self._own_parser is not None:
+            return self._own_parser
+        if not self._available:
+            return None
+        return get_thread_parser(self.LANGUAGE)
+
+    @_parser.setter
+    def _parser(self, parser: Optional[Any]) -> None:
+        # Subclasses that configure their own parser (e.g. TypeScript/TSX
+        # switching) keep using it instead of the shared per-thread one.
+        self._own_parser = parser
+
     def is_available(self) -> bool:
         """
         Check if tree-sitter is available for this language.
@@ -50,39 +130,11 @@ class TreeSitterMixin:
             return self._available
 
         try:
-            from code_map.dependencies import optional_dependencies
-
-            modules = optional_dependencies.load("tree_sitter_languages")
-            if not modules:
-                self._available = False
-                return False
-
-            import warnings
-
-            parser_cls = getattr(modules.get("tree_sitter"), "Parser", None)
-            get_language = getattr(
-                modules.get("tree_sitter_languages"), "get_language", None
-            )
-
-            if parser_cls is None or get_language is None:
-                self._available = False
-                return False
-
-            # Suppress FutureWarning from tree-sitter
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=FutureWarning)
-                language = get_language(self.LANGUAGE)
-
-            parser = parser_cls()
-            parser.set_language(language)
-            self._parser = parser
-            self._available = True
-            return True
-
+            self._available = get_thread_parser(self.LANGUAGE) is not None
         except Exception as e:
             logger.debug(f"tree-sitter not available for {self.LANGUAGE}: {e}")
             self._available = False
-            return False
+        return self._available
 
     def _ensure_parser(self) -> bool:
         """
@@ -105,9 +157,16 @@ class TreeSitterMixin:
         Yields:
             All nodes in the subtree including the root.
         """
-        yield node
-        for child in node.children:
-            yield from self._walk_tree(child)
+        # Explicit stack instead of recursive generators: one frame per walk
+        stack = [node]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            current = pop()
+            yield current
+            children = current.children
+            if children:
+                extend(reversed(children))
 
     def _get_node_text(self, node: Any, source: bytes) -> str:
         """
@@ -15,10 +15,20 @@ Limitations (by design):
 from __future__ import annotations
 
 import logging
+import mmap
+import os
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
+from .base.tree_sitter import get_thread_parser, load_language
 from .models import CallEdge, CallGraph, CallNode, IgnoredCall, ResolutionStatus
 
 logger = logging.getLogger(__name__)
@@ -125,6 +135,57 @@ CPP_STDLIB_NAMESPACES: Set[str] = {
     "absl",
 }
 
+# Files above this size are not scanned for entry points; tree-sitter's
+# memory use grows far faster than the input on pathological sources
+MAX_SOURCE_BYTES = 4 * 1024 * 1024
+
+# Files above this size are memory-mapped instead of copied into a bytes
+# object, and fed to tree-sitter in chunks
+MMAP_THRESHOLD_BYTES = 256 * 1024
+_PARSE_CHUNK_BYTES = 64 * 1024
+
+# Parsed trees kept per extractor, keyed by resolved path and invalidated
+# on change. Files above MMAP_THRESHOLD_BYTES are never cached, and the
+# cached sources are capped in total (trees take several times more)
+TREE_CACHE_SIZE = 256
+TREE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Set once the C++ grammar has loaded in this process; lets hot paths skip
+# the per-instance availability check
+_PARSER_READY = False
+
+
+def _entry_point_columns() -> Dict[str, Any]:
+    """Empty entry point columns, in list_entry_points key order."""
+    return {
+        "name": [],
+        "qualified_name": [],
+        "line": array("I"),
+        "kind": [],
+        "class_name": [],
+        "node_count": [],
+    }
+
+
+def _may_define_functions(source: Any) -> bool:
+    """
+    Cheap byte prescan: could source contain a function_definition?
+
+    Definitions need a body, except defaulted and deleted ones
+    (``Foo::Foo() = default;``), which tree-sitter-cpp also parses as
+    function_definition. Declaration-only headers fail all three checks.
+    """
+    return b"{" in source or b"default" in source or b"delete" in source
+
+
+@lru_cache(maxsize=None)
+def _call_query() -> Optional[Any]:
+    """Compile the call_expression query once per process."""
+    loaded = load_language("cpp")
+    if loaded is None:
+        return None
+    return loaded[1].query("(call_expression) @call")
+
 
 @dataclass
 class CppCallInfo:
@@ -155,67 +216,173 @@ class CppCallFlowExtractor:
     """
 
     # C++ file extensions
-    CPP_EXTENSIONS = {".cpp", ".c", ".hpp", ".h", ".cc", ".cxx", ".hxx"}
+    CPP_EXTENSIONS = frozenset({".cpp", ".c", ".hpp", ".h", ".cc", ".cxx", ".hxx"})
+
+    def __init__(self, tree_cache_size: int = TREE_CACHE_SIZE) -> None:
+        """
+        Initialize the extractor with tree-sitter parser.
 
-    def __init__(self) -> None:
-        """Initialize the extractor with tree-sitter parser."""
-        self._parser: Optional[Any] = None
+        Args:
+            tree_cache_size: Parsed files to keep for re-scans (0 disables)
+        """
         self._available: Optional[bool] = None
+        # Node text by source bytes, shared by repeated names; reset per file
+        self._name_cache: Dict[bytes, str] = {}
+        # path -> ((mtime_ns, size), source, tree), least recently used first
+        self._tree_cache: OrderedDict[Path, Tuple[Tuple[int, int], bytes, Any]] = (
+            OrderedDict()
+        )
+        self._tree_cache_size = tree_cache_size
+        self._tree_cache_bytes = 0
+        self._tree_cache_lock = threading.Lock()
+
+    @property
+    def _parser(self) -> Optional[Any]:
+        """C++ parser owned by the calling thread (grammar loaded once)."""
+        if not (_PARSER_READY or self._available):
+            return None
+        return get_thread_parser("cpp")
 
     def is_available(self) -> bool:
         """Check if tree-sitter with C++ support is available."""
         if self._available is not None:
             return self._available
 
+        global _PARSER_READY
         try:
-            from code_map.dependencies import optional_dependencies
-
-            modules = optional_dependencies.load("tree_sitter_languages")
-            if not modules:
-                self._available = False
-                return False
-
-            import warnings
-
-            parser_cls = getattr(modules.get("tree_sitter"), "Parser", None)
-            get_language = getattr(
-                modules.get("tree_sitter_languages"), "get_language", None
-            )
-
-            if parser_cls is None or get_language is None:
-                self._available = False
-                return False
-
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=FutureWarning)
-                language = get_language("cpp")
-
-            parser = parser_cls()
-            parser.set_language(language)
-            self._parser = parser
-            self._available = True
-            return True
-
+            self._available = get_thread_parser("cpp") is not None
+            _PARSER_READY = _PARSER_READY or self._available
         except Exception as e:
             logger.debug(f"C++ tree-sitter not available: {e}")
             self._available = False
-            return False
+        return self._available
 
     def _ensure_parser(self) -> bool:
         """Ensure parser is initialized."""
-        if self._parser is not None:
+        if self._available:
             return True
         return self.is_available()
 
+    def _get_cached_tree(
+        self, file_path: Path, stat: os.stat_result
+    ) -> Optional[Tuple[bytes, Any]]:
+        """
+        Take the cached (source, tree) for a file out of the cache.
+
+        tree-sitter trees must not be shared between threads, so the entry
+        is removed while in use: a concurrent request for the same file
+        misses and parses its own copy. Hand it back with _cache_tree.
+
+        Returns:
+            (source, tree) if the file is cached and unchanged, else None
+        """
+        key = file_path.resolve()
+        with self._tree_cache_lock:
+            cached = self._tree_cache.pop(key, None)
+            if cached is None:
+                return None
+            self._tree_cache_bytes -= len(cached[1])
+            if cached[0] != (stat.st_mtime_ns, stat.st_size):
+                return None
+            return cached[1], cached[2]
+
+    def _cache_tree(
+        self, file_path: Path, stat: os.stat_result, source: bytes, tree: Any
+    ) -> None:
+        """
+        Remember a parsed file the caller is done with.
+
+        Evicts least recently used entries beyond TREE_CACHE_SIZE files or
+        TREE_CACHE_MAX_BYTES of source; large files are not cached.
+        """
+        size = len(source)
+        if self._tree_cache_size <= 0 or size > MMAP_THRESHOLD_BYTES:
+            return
+        key = file_path.resolve()
+        with self._tree_cache_lock:
+            previous = self._tree_cache.pop(key, None)
+            if previous is not None:
+                self._tree_cache_bytes -= len(previous[1])
+            self._tree_cache[key] = ((stat.st_mtime_ns, stat.st_size), source, tree)
+            self._tree_cache_bytes += size
+            while self._tree_cache and (
+                len(self._tree_cache) > self._tree_cache_size
+                or self._tree_cache_bytes > TREE_CACHE_MAX_BYTES
+            ):
+                _, (_, evicted, _) = self._tree_cache.popitem(last=False)
+                self._tree_cache_bytes -= len(evicted)
+
     def _walk_tree(self, node: Any):
-        """Walk tree yielding all nodes."""
-        yield node
-        for child in node.children:
-            yield from self._walk_tree(child)
+        """Walk tree yielding all nodes (pre-order, without recursion)."""
+        stack = [node]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            current = pop()
+            yield current
+            children = current.children
+            if children:
+                extend(reversed(children))
+
+    def _iter_function_definitions(
+        self, root: Any, source: bytes
+    ) -> Iterator[Tuple[Any, Optional[str], bool]]:
+        """
+        Yield every function_definition node under root with its context.
+
+        Uses a native TreeCursor DFS so non-function nodes never become
+        Python-level generator frames. Enclosing classes and template
+        declarations are tracked on stacks during the same walk, so no
+        per-function parent walk is needed.
+
+        Yields:
+            (node, enclosing class name or None, inside a template declaration)
+        """
+        cursor = root.walk()
+        depth = 0
+        # (depth, name) of enclosing named classes/structs, innermost last
+        class_stack: List[Tuple[int, str]] = []
+        template_depths: List[int] = []
+
+        while True:
+            node = cursor.node
+            node_type = node.type
+            if node_type == "function_definition":
+                yield (
+                    node,
+                    class_stack[-1][1] if class_stack else None,
+                    bool(template_depths),
+                )
+            elif node_type in ("class_specifier", "struct_specifier"):
+                for child in node.children:
+                    if child.type == "type_identifier":
+                        name = self._get_node_text(child, source)
+                        class_stack.append((depth, name))
+                        break
+            elif node_type == "template_declaration":
+                template_depths.append(depth)
+
+            if cursor.goto_first_child():
+                depth += 1
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
+                depth -= 1
+            # Moved to a sibling: drop context opened by the nodes we left
+            while class_stack and class_stack[-1][0] >= depth:
+                class_stack.pop()
+            while template_depths and template_depths[-1] >= depth:
+                template_depths.pop()
 
     def _get_node_text(self, node: Any, source: bytes) -> str:
-        """Get text content of a node."""
-        return source[node.start_byte : node.end_byte].decode("utf-8")
+        """Get text content of a node, interning repeated names."""
+        raw = source[node.start_byte : node.end_byte]
+        text = self._name_cache.get(raw)
+        if text is None:
+            text = sys.intern(raw.decode("utf-8"))
+            self._name_cache[raw] = text
+        return text
 
     def _get_function_name(self, node: Any, source: bytes) -> Optional[str]:
         """
@@ -252,12 +419,8 @@ class CppCallFlowExtractor:
                 return self._get_node_text(child, source)
         return None
 
-    def _get_class_context(self, node: Any, source: bytes) -> Optional[str]:
-        """
-        Get the class name if this function is defined inside a class.
-
-        Also checks for qualified names like Class::method.
-        """
+    def _get_qualified_class(self, node: Any, source: bytes) -> Optional[str]:
+        """Get the class name from an out-of-class definition (Class::method)."""
         # Check for qualified identifier in function_declarator
         for child in node.children:
             if child.type == "function_declarator":
@@ -274,6 +437,17 @@ class CppCallFlowExtractor:
                                 if part.next_sibling is not None:
                                     return text
                         break
+        return None
+
+    def _get_class_context(self, node: Any, source: bytes) -> Optional[str]:
+        """
+        Get the class name if this function is defined inside a class.
+
+        Also checks for qualified names like Class::method.
+        """
+        qualified_class = self._get_qualified_class(node, source)
+        if qualified_class:
+            return qualified_class
 
         # Check parent nodes for class definition
         parent = node.parent
@@ -286,24 +460,11 @@ class CppCallFlowExtractor:
 
         return None
 
-    def _is_template_function(self, node: Any) -> bool:
-        """Check if this is a template function."""
-        parent = node.parent
-        while parent:
-            if parent.type == "template_declaration":
-                return True
-            parent = parent.parent
-        return False
-
     def _should_skip_function(self, name: str) -> bool:
         """Check if function should be skipped."""
-        # Skip private/internal functions (starting with underscore)
-        if name.startswith("_") and not name.startswith("__"):
-            return True
-        # Skip common internal patterns
-        if name in ("main",):
-            return False  # Always include main
-        return False
+        # Skip private/internal functions: a single leading underscore,
+        # but not dunder-style names (main and everything else is kept)
+        return name[:1] == "_" and name[1:2] != "_"
 
     def _count_calls_in_node(self, node: Any) -> int:
         """
@@ -321,6 +482,22 @@ class CppCallFlowExtractor:
                 count += 1
         return count
 
+    def _call_start_bytes(self, root: Any) -> Optional[List[int]]:
+        """
+        Collect the sorted start offsets of every call_expression under root.
+
+        Runs a single tree-sitter query in C. Calls inside a function are
+        exactly those whose start offset falls within the function's byte
+        range, so per-function counts become two bisections.
+
+        Returns:
+            Sorted start bytes, or None if the query could not be compiled
+        """
+        query = _call_query()
+        if query is None:
+            return None
+        return sorted(node.start_byte for node, _ in query.captures(root))
+
     def list_entry_points(self, file_path: Path) -> List[Dict[str, Any]]:
         """
         List all functions and methods in a C++ file that could be entry points.
@@ -331,61 +508,210 @@ class CppCallFlowExtractor:
         Returns:
             List of entry point info with name, qualified_name, line, kind, node_count
         """
-        if not self._ensure_parser():
-            return []
+        columns = self.list_entry_points_columns(file_path)
+        keys = tuple(columns)
+        return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+    def list_entry_points_columns(self, file_path: Path) -> Dict[str, Any]:
+        """
+        List entry points of a C++ file as parallel columns.
+
+        Cheaper to build and serialize than one dict per function when a
+        caller scans many files; ``list_entry_points`` is the row view.
+
+        Args:
+            file_path: Path to C++ file
+
+        Returns:
+            Mapping of name, qualified_name, line (array of unsigned ints),
+            kind, class_name and node_count to equally long sequences
+        """
+        if not _PARSER_READY and not self._ensure_parser():
+            return _entry_point_columns()
 
         try:
-            source = file_path.read_bytes()
+            stat = file_path.stat()
+            if stat.st_size > MAX_SOURCE_BYTES:
+                logger.warning(
+                    "Skipping %s: %d bytes exceeds %d",
+                    file_path,
+                    stat.st_size,
+                    MAX_SOURCE_BYTES,
+                )
+                return _entry_point_columns()
+            mapped = None
+            if stat.st_size > MMAP_THRESHOLD_BYTES:
+                mapped = self._map_source(file_path)
+            if mapped is not None:
+                try:
+                    if not _may_define_functions(mapped):
+                        return _entry_point_columns()
+                    # Hand tree-sitter slices of the mapping, not one full copy
+                    tree = self._parser.parse(
+                        lambda offset, _point: mapped[
+                            offset : offset + _PARSE_CHUNK_BYTES
+                        ]
+                    )
+                    return self._collect_entry_points(mapped, tree)
+                finally:
+                    mapped.close()
+
+            cached = self._get_cached_tree(file_path, stat)
+            if cached is None:
+                source = file_path.read_bytes()
         except OSError as e:
             logger.error(f"Failed to read file {file_path}: {e}")
-            return []
+            return _entry_point_columns()
 
-        tree = self._parser.parse(source)
-        entry_points: List[Dict[str, Any]] = []
+        if cached is not None:
+            source, tree = cached
+        else:
+            if not _may_define_functions(source):
+                return _entry_point_columns()
+            tree = self._parser.parse(source)
+        try:
+            return self._collect_entry_points(source, tree)
+        finally:
+            self._cache_tree(file_path, stat, source, tree)
 
-        for node in self._walk_tree(tree.root_node):
-            if node.type == "function_definition":
-                func_name = self._get_function_name(node, source)
+    def _map_source(self, file_path: Path) -> Optional[mmap.mmap]:
+        """
+        Memory-map a source file read-only.
 
-                if not func_name:
-                    continue
+        Returns:
+            The mapping, or None if the file cannot be mapped (e.g. it was
+            truncated to zero bytes after being stat'ed); callers then fall
+            back to reading it
+        """
+        with file_path.open("rb") as handle:
+            try:
+                return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                logger.debug("Cannot map %s, reading it instead: %s", file_path, e)
+                return None
+
+    def _collect_entry_points(self, source: Any, tree: Any) -> Dict[str, Any]:
+        """
+        Collect the entry points of a parsed C++ file.
 
-                if self._should_skip_function(func_name):
-                    continue
+        Args:
+            source: Source as bytes or a read-only mmap (sliced for node text)
+            tree: tree-sitter tree parsed from source
 
-                class_name = self._get_class_context(node, source)
-                is_template = self._is_template_function(node)
+        Returns:
+            Entry point columns, as returned by list_entry_points_columns
+        """
+        self._name_cache.clear()
+        columns = _entry_point_columns()
+        names = columns["name"]
+        qualified_names = columns["qualified_name"]
+        lines = columns["line"]
+        kinds = columns["kind"]
+        class_names = columns["class_name"]
+        node_counts = columns["node_count"]
+        call_starts = self._call_start_bytes(tree.root_node)
+
+        for node, enclosing_class, is_template in self._iter_function_definitions(
+            tree.root_node, source
+        ):
+            func_name = self._get_function_name(node, source)
+
+            if not func_name:
+                continue
 
-                if class_name:
-                    qualified_name = f"{class_name}::{func_name}"
-                    kind = "method"
-                else:
-                    qualified_name = func_name
-                    kind = "function"
+            if self._should_skip_function(func_name):
+                continue
 
-                if is_template:
-                    kind = f"template_{kind}"
+            class_name = self._get_qualified_class(node, source) or enclosing_class
 
-                # Count calls within this function
-                call_count = self._count_calls_in_node(node)
+            if class_name:
+                qualified_name = f"{class_name}::{func_name}"
+                kind = "method"
+            else:
+                qualified_name = func_name
+                kind = "function"
 
-                entry_points.append(
-                    {
-                        "name": func_name,
-                        "qualified_name": qualified_name,
-                        "line": node.start_point[0] + 1,
-                        "kind": kind,
-                        "class_name": class_name,
-                        "node_count": call_count,
-                    }
+            if is_template:
+                kind = f"template_{kind}"
+
+            # Count calls within this function
+            if call_starts is None:
+                call_count = self._count_calls_in_node(node)
+            else:
+                call_count = bisect_left(call_starts, node.end_byte) - bisect_left(
+                    call_starts, node.start_byte
                 )
 
-        return entry_points
+            names.append(func_name)
+            qualified_names.append(qualified_name)
+            lines.append(node.start_point[0] + 1)
+            kinds.append(kind)
+            class_names.append(class_name)
+            node_counts.append(call_count)
+
+        return columns
+
+    @classmethod
+    def list_entry_points_many(
+        cls, paths: Sequence[Path], workers: Optional[int] = None
+    ) -> Dict[Path, List[Dict[str, Any]]]:
+        """
+        List entry points for many C++ files, parsing them in parallel.
+
+        Parsing and node walking are CPU-bound Python work, so files are
+        spread across worker processes, each reusing one extractor.
+
+        Args:
+            paths: C++ files to scan
+            workers: Number of worker processes (default: CPU count).
+                     With 1 worker (or a single file) files are scanned serially.
+
+        Returns:
+            Mapping of each path to its entry points, in input order
+        """
+        paths = list(paths)
+        if not cls.is_available_for_paths(paths):
+            return {path: [] for path in paths}
+        if workers == 1 or len(paths) <= 1:
+            extractor = cls()
+            return {path: extractor.list_entry_points(path) for path in paths}
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_entry_points_worker
+        ) as executor:
+            results = executor.map(_entry_points_worker, paths, chunksize=32)
+            return dict(zip(paths, results))
+
+    @classmethod
+    def is_available_for_paths(cls, paths: Iterable[Path]) -> bool:
+        """
+        Check whether a batch of files needs (and can use) the C++ parser.
+
+        The grammar is only probed when at least one path has a C++
+        extension, so batches without C++ files never load it.
+
+        Args:
+            paths: Files a caller is about to scan
+
+        Returns:
+            True if any path is a C++ file and tree-sitter C++ is available
+        """
+        if not any(cls.supports_extension(path.suffix) for path in paths):
+            return False
+        if _PARSER_READY:
+            return True
+        try:
+            return load_language("cpp") is not None
+        except Exception as e:
+            logger.debug(f"C++ tree-sitter not available: {e}")
+            return False
 
     @classmethod
     def supports_extension(cls, extension: str) -> bool:
         """Check if this extractor supports the given file extension."""
-        return extension.lower() in cls.CPP_EXTENSIONS
+        # Extensions are stored lowercase; only fold case on a miss
+        extensions = cls.CPP_EXTENSIONS
+        return extension in extensions or extension.lower() in extensions
 
     # ─────────────────────────────────────────────────────────────
     # Complexity Calculation
@@ -470,7 +796,7 @@ class CppCallFlowExtractor:
         Returns:
             CallGraph containing all reachable calls, or None if extraction fails
         """
-        if not self._ensure_parser():
+        if not _PARSER_READY and not self._ensure_parser():
             logger.warning("tree-sitter not available for C++ call flow extraction")
             return None
 
@@ -478,12 +804,36 @@ class CppCallFlowExtractor:
         effective_root = project_root or file_path.parent
 
         try:
-            source = file_path.read_bytes()
+            stat = file_path.stat()
+            cached = self._get_cached_tree(file_path, stat)
+            if cached is None:
+                source = file_path.read_bytes()
         except OSError as e:
             logger.error("Failed to read file %s: %s", file_path, e)
             return None
 
-        tree = self._parser.parse(source)
+        if cached is not None:
+            source, tree = cached
+        else:
+            tree = self._parser.parse(source)
+        try:
+            return self._extract_from_tree(
+                file_path, function_name, max_depth, effective_root, source, tree
+            )
+        finally:
+            self._cache_tree(file_path, stat, source, tree)
+
+    def _extract_from_tree(
+        self,
+        file_path: Path,
+        function_name: str,
+        max_depth: int,
+        effective_root: Path,
+        source: bytes,
+        tree: Any,
+    ) -> Optional[CallGraph]:
+        """Build the call graph of function_name from a parsed file."""
+        self._name_cache.clear()
 
         # Find the target function
         func_node, class_name = self._find_function_by_name(
@@ -998,3 +1348,24 @@ class CppCallFlowExtractor:
             return (None, ResolutionStatus.UNRESOLVED, None)
 
         return (None, ResolutionStatus.UNRESOLVED, None)
+
+
+# ─────────────────────────────────────────────────────────────
+# Process pool workers for list_entry_points_many
+# ─────────────────────────────────────────────────────────────
+
+_worker_extractor: Optional[CppCallFlowExtractor] = None
+
+
+def _init_entry_points_worker() -> None:
+    """Build the per-process extractor (and its parser) once."""
+    global _worker_extractor
+    # Each worker sees a file once, so keeping trees would only cost memory
+    _worker_extractor = CppCallFlowExtractor(tree_cache_size=0)
+    _worker_extractor.is_available()
+
+
+def _entry_points_worker(file_path: Path) -> List[Dict[str, Any]]:
+    """List entry points for one file inside a worker process."""
+    extractor = _worker_extractor or CppCallFlowExtractor(tree_cache_size=0)
+    return extractor.list_entry_points(file_path)
@@ -156,7 +156,9 @@ class BaseCallFlowExtractor(TreeSitterMixin, MetricsMixin, SymbolMixin, ABC):
         Returns:
             True if extension is supported.
         """
-        return extension.lower() in cls.EXTENSIONS
+        # Extensions are declared lowercase; only fold case on a miss
+        extensions = cls.EXTENSIONS
+        return extension in extensions or extension.lower() in extensions
 
     def _get_docstring(self, func_node: Any, source: str) -> Optional[str]:
         """
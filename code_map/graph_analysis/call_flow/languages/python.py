@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from .base_extractor import BaseCallFlowExtractor
+from ..base.tree_sitter import load_language
 from ..constants import PYTHON_BUILTINS, is_stdlib
 from ..models import CallEdge, CallGraph, CallNode, IgnoredCall, ResolutionStatus
 from ..type_resolver import TypeResolver, ScopeInfo
@@ -117,28 +118,13 @@ class PythonCallFlowExtractor(BaseCallFlowExtractor):
             return self._available
 
         try:
-            from code_map.dependencies import optional_dependencies
-
-            modules = optional_dependencies.load("tree_sitter_languages")
-            if not modules:
-                self._available = False
-                return False
-
-            import warnings
-
-            parser_cls = getattr(modules.get("tree_sitter"), "Parser", None)
-            get_language = getattr(
-                modules.get("tree_sitter_languages"), "get_language", None
-            )
-
-            if parser_cls is None or get_language is None:
+            # Grammar is loaded once per process and shared by all instances
+            loaded = load_language("python")
+            if loaded is None:
                 self._available = False
                 return False
 
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=FutureWarning)
-                language = get_language("python")
-
+            parser_cls, language = loaded
             parser = parser_cls()
             parser.set_language(language)
             self._parser = parser
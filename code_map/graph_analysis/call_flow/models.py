@@ -11,10 +11,48 @@ Includes resolution status tracking to distinguish between:
 
 from __future__ import annotations
 
+import json
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import count
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional
+
+from ...dependencies import optional_dependencies
+
+
+# Serialized field order for CallNode/CallEdge.to_dict
+_NODE_FIELDS = (
+    "id",
+    "name",
+    "qualified_name",
+    "file_path",
+    "line",
+    "column",
+    "kind",
+    "is_entry_point",
+    "depth",
+    "docstring",
+    "symbol_id",
+    "resolution_status",
+    "reasons",
+    "complexity",
+    "loc",
+)
+_get_node_fields = attrgetter(*_NODE_FIELDS)
+
+_EDGE_FIELDS = (
+    "source_id",
+    "target_id",
+    "call_site_line",
+    "call_type",
+    "arguments",
+    "expression",
+    "resolution_status",
+)
+_get_edge_fields = attrgetter(*_EDGE_FIELDS)
 
 
 class ResolutionStatus(str, Enum):
@@ -33,7 +71,7 @@ class ResolutionStatus(str, Enum):
     AMBIGUOUS = "ambiguous"  # Multiple possible targets
 
 
-@dataclass
+@dataclass(slots=True)
 class IgnoredCall:
     """
     Represents a call that was intentionally not expanded.
@@ -70,7 +108,7 @@ class IgnoredCall:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CallNode:
     """
     A node in the call flow graph representing a function or method.
@@ -111,23 +149,10 @@ class CallNode:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "qualified_name": self.qualified_name,
-            "file_path": str(self.file_path) if self.file_path else None,
-            "line": self.line,
-            "column": self.column,
-            "kind": self.kind,
-            "is_entry_point": self.is_entry_point,
-            "depth": self.depth,
-            "docstring": self.docstring,
-            "symbol_id": self.symbol_id,
-            "resolution_status": self.resolution_status.value,
-            "reasons": self.reasons,
-            "complexity": self.complexity,
-            "loc": self.loc,
-        }
+        data = dict(zip(_NODE_FIELDS, _get_node_fields(self)))
+        data["file_path"] = str(self.file_path) if self.file_path else None
+        data["resolution_status"] = self.resolution_status.value
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CallNode":
@@ -152,7 +177,7 @@ class CallNode:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CallEdge:
     """
     An edge representing a function call from source to target.
@@ -179,15 +204,9 @@ class CallEdge:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "source_id": self.source_id,
-            "target_id": self.target_id,
-            "call_site_line": self.call_site_line,
-            "call_type": self.call_type,
-            "arguments": self.arguments,
-            "expression": self.expression,
-            "resolution_status": self.resolution_status.value,
-        }
+        data = dict(zip(_EDGE_FIELDS, _get_edge_fields(self)))
+        data["resolution_status"] = self.resolution_status.value
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CallEdge":
@@ -204,7 +223,7 @@ class CallEdge:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CallGraph:
     """
     Complete call flow graph from an entry point.
@@ -304,60 +323,59 @@ class CallGraph:
         Returns:
             Dictionary with 'nodes', 'edges', and 'metadata' for React Flow.
         """
-        react_nodes = []
-        react_edges = []
-
-        # Calculate positions (simple left-to-right by depth)
-        depth_counts: Dict[int, int] = {}
-
-        for node in self.iter_nodes():
-            depth = node.depth
-            y_index = depth_counts.get(depth, 0)
-            depth_counts[depth] = y_index + 1
-
-            react_nodes.append(
-                {
-                    "id": node.id,
-                    "type": "callNode",
-                    "position": {
-                        "x": depth * 280,
-                        "y": y_index * 120,
-                    },
-                    "data": {
-                        "label": node.name,
-                        "qualifiedName": node.qualified_name,
-                        "filePath": str(node.file_path) if node.file_path else None,
-                        "line": node.line,
-                        "column": node.column,
-                        "kind": node.kind,
-                        "isEntryPoint": node.is_entry_point,
-                        "depth": node.depth,
-                        "docstring": node.docstring,
-                        "symbolId": node.symbol_id,
-                        "resolutionStatus": node.resolution_status.value,
-                        "reasons": node.reasons,
-                        "complexity": node.complexity,
-                        "loc": node.loc,
-                    },
-                }
-            )
-
-        for i, edge in enumerate(self.iter_edges()):
-            react_edges.append(
-                {
-                    "id": f"e{i}",
-                    "source": edge.source_id,
-                    "target": edge.target_id,
-                    "type": "smoothstep",
-                    "animated": edge.source_id == self.entry_point,
-                    "data": {
-                        "callSiteLine": edge.call_site_line,
-                        "callType": edge.call_type,
-                        "expression": edge.expression,
-                        "resolutionStatus": edge.resolution_status.value,
-                    },
-                }
-            )
+        nodes = list(self.iter_nodes())
+
+        # Positions as a column computed in one pass (simple left-to-right
+        # by depth, stacked top-to-bottom within each depth)
+        depth_counters: DefaultDict[int, Iterator[int]] = defaultdict(count)
+        y_indices = [next(depth_counters[node.depth]) for node in nodes]
+
+        react_nodes = [
+            {
+                "id": node.id,
+                "type": "callNode",
+                "position": {
+                    "x": node.depth * 280,
+                    "y": y_index * 120,
+                },
+                "data": {
+                    "label": node.name,
+                    "qualifiedName": node.qualified_name,
+                    "filePath": str(node.file_path) if node.file_path else None,
+                    "line": node.line,
+                    "column": node.column,
+                    "kind": node.kind,
+                    "isEntryPoint": node.is_entry_point,
+                    "depth": node.depth,
+                    "docstring": node.docstring,
+                    "symbolId": node.symbol_id,
+                    "resolutionStatus": node.resolution_status.value,
+                    "reasons": node.reasons,
+                    "complexity": node.complexity,
+                    "loc": node.loc,
+                },
+            }
+            for node, y_index in zip(nodes, y_indices)
+        ]
+
+        entry_point = self.entry_point
+        edge_id = "e%d"
+        react_edges = [
+            {
+                "id": edge_id % i,
+                "source": edge.source_id,
+                "target": edge.target_id,
+                "type": "smoothstep",
+                "animated": edge.source_id == entry_point,
+                "data": {
+                    "callSiteLine": edge.call_site_line,
+                    "callType": edge.call_type,
+                    "expression": edge.expression,
+                    "resolutionStatus": edge.resolution_status.value,
+                },
+            }
+            for i, edge in enumerate(self.edges)
+        ]
 
         return {
             "nodes": react_nodes,
@@ -374,3 +392,21 @@ class CallGraph:
                 "diagnostics": self.diagnostics,
             },
         }
+
+    def to_react_flow_json(self) -> bytes:
+        """
+        Serialize the React Flow payload to compact JSON.
+
+        Uses orjson when it is installed and falls back to the stdlib
+        json module otherwise; both produce equivalent documents. The
+        /call-flow endpoint still returns to_react_flow() through its
+        response model; this is for callers that need raw bytes.
+
+        Returns:
+            UTF-8 encoded JSON of to_react_flow()
+        """
+        payload = self.to_react_flow()
+        orjson = optional_dependencies.require("orjson")
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS, default=str)
+        return json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
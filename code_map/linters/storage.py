@@ -6,13 +6,14 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional
 
 from sqlmodel import Session, select, desc, or_
-from sqlalchemy import select as sa_select
+from sqlalchemy import Engine, select as sa_select
 
-from ..database import get_engine, init_db
+from ..database import get_db_path, get_engine, init_db
 from ..database_async import get_async_session, init_async_db
 from ..models import LinterReportDB, NotificationDB
 from .report_schema import (
@@ -23,11 +24,26 @@ from .report_schema import (
     report_to_dict,
 )
 
+_UTC = timezone.utc
+
+MAX_PAYLOAD_BYTES = 256 * 1024
+MAX_REPORT_BYTES = 16 * 1024 * 1024
+
+
+@lru_cache(maxsize=1024)
+def _normalize_absolute_root(root_str: str) -> str:
+    # Only absolute inputs are cached: relative and "~" paths depend on the
+    # current directory and HOME, so their resolution can change
+    return str(Path(root_str).resolve())
+
 
 def _normalize_root(root: Optional[str | Path]) -> Optional[str]:
     if root is None:
         return None
-    return str(Path(root).expanduser().resolve())
+    root_str = str(root)
+    if Path(root_str).is_absolute():
+        return _normalize_absolute_root(root_str)
+    return str(Path(root_str).expanduser().resolve())
 
 
 def _normalize_path_map(env: Optional[Mapping[str, str]]) -> Optional[Path]:
@@ -40,6 +56,38 @@ def _normalize_path_map(env: Optional[Mapping[str, str]]) -> Optional[Path]:
     return Path(p) if p else None
 
 
+def _encode_payload(payload: Mapping[str, Any], *, max_bytes: int) -> str:
+    """Serializa un payload a JSON y rechaza los que superan ``max_bytes``."""
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    if len(raw.encode("utf-8")) > max_bytes:
+        raise ValueError(f"payload exceeds {max_bytes} bytes")
+    return raw
+
+
+# Engines by resolved database path; in practice one per process, so never
+# evicted (an evicted engine would keep its SQLite pool open until collected)
+_ENGINES: Dict[Path, Engine] = {}
+
+
+def _engine_for_path(db_path: Path) -> Engine:
+    # Resolve so relative or "~" spellings of one database share an engine
+    db_path = db_path.expanduser().resolve()
+    engine = _ENGINES.get(db_path)
+    if engine is None:
+        # create_engine opens no connection, so a lost race costs nothing
+        engine = _ENGINES.setdefault(db_path, get_engine(db_path))
+    return engine
+
+
+def _engine_for(env: Optional[Mapping[str, str]]) -> Engine:
+    """Devuelve un engine cacheado por ruta de base de datos.
+
+    Un ``Mapping`` no es hashable, así que la clave de caché es la ruta
+    resuelta de la base de datos (la única parte de ``env`` que influye).
+    """
+    return _engine_for_path(_normalize_path_map(env) or get_db_path())
+
+
 def _parse_datetime(value: str) -> datetime:
     if value.endswith("Z"):
         value = value.replace("Z", "+00:00")
@@ -115,18 +163,19 @@ def record_linters_report(
     overall_status = summary.get("overall_status", CheckStatus.PASS.value)
     issues_total = _coerce_int(summary.get("issues_total", 0), default=0)
     critical_issues = _coerce_int(summary.get("critical_issues", 0), default=0)
+    serialized_payload = _encode_payload(payload, max_bytes=MAX_REPORT_BYTES)
 
-    engine = get_engine(_normalize_path_map(env))
+    engine = _engine_for(env)
     init_db(engine)
 
     with Session(engine) as session:
         db_report = LinterReportDB(
-            generated_at=datetime.now(timezone.utc),
+            generated_at=datetime.now(_UTC),
             root_path=_normalize_root(payload.get("root_path")) or "",
             overall_status=overall_status,
             issues_total=issues_total,
             critical_issues=critical_issues,
-            payload=json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+            payload=serialized_payload,
         )
         session.add(db_report)
         session.commit()
@@ -151,7 +200,7 @@ def get_linters_report(
     report_id: int, *, env: Optional[Mapping[str, str]] = None
 ) -> Optional[StoredLintersReport]:
     """Obtiene un reporte por ID."""
-    engine = get_engine(_normalize_path_map(env))
+    engine = _engine_for(env)
     with Session(engine) as session:
         item = session.get(LinterReportDB, report_id)
         if not item:
@@ -165,7 +214,7 @@ def get_latest_linters_report(
     root_path: Optional[str | Path] = None,
 ) -> Optional[StoredLintersReport]:
     """Obtiene el reporte más reciente, opcionalmente filtrado por root."""
-    engine = get_engine(_normalize_path_map(env))
+    engine = _engine_for(env)
     normalized_root = _normalize_root(root_path)
 
     with Session(engine) as session:
@@ -191,7 +240,7 @@ def list_linters_reports(
 ) -> List[StoredLintersReport]:
     """Lista reportes ordenados por fecha de creación descendente."""
     normalized_root = _normalize_root(root_path)
-    engine = get_engine(_normalize_path_map(env))
+    engine = _engine_for(env)
 
     with Session(engine) as session:
         statement = select(LinterReportDB)
@@ -220,18 +269,16 @@ def record_notification(
 ) -> int:
     """Almacena una notificación vinculada al ecosistema de linters."""
     serialized_payload = (
-        json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-        if payload
-        else None
+        _encode_payload(payload, max_bytes=MAX_PAYLOAD_BYTES) if payload else None
     )
     normalized_root = _normalize_root(root_path)
 
-    engine = get_engine(_normalize_path_map(env))
+    engine = _engine_for(env)
     init_db(engine)
 
     with Session(engine) as session:
         notif = NotificationDB(
-            created_at=datetime.now(timezone.utc),
+            created_at=datetime.now(_UTC),
             channel=channel,
             severity=severity.value,
             title=title,
@@ -267,7 +314,7 @@ def get_notification(
     env: Optional[Mapping[str, str]] = None,
 ) -> Optional[StoredNotification]:
     """Obtiene una notificación por ID."""
-    engine = get_engine(_normalize_path_map(env))
+    engine = _engine_for(env)
     with Session(engine) as session:
         item = session.get(NotificationDB, notification_id)
         if not item:
@@ -284,7 +331,7 @@ def list_notifications(
 ) -> List[StoredNotification]:
     """Recupera notificaciones ordenadas por fecha descendente."""
     normalized_root = _normalize_root(root_path)
-    engine = get_engine(_normalize_path_map(env))
+    engine = _engine_for(env)
 
     with Session(engine) as session:
         statement = select(NotificationDB)
@@ -310,7 +357,7 @@ def mark_notification_read(
     read: bool = True,
 ) -> bool:
     """Actualiza el estado de leído de una notificación."""
-    engine = get_engine(_normalize_path_map(env))
+    engine = _engine_for(env)
     with Session(engine) as session:
         notif = session.get(NotificationDB, notification_id)
         if not notif:
@@ -337,15 +384,16 @@ async def record_linters_report_async(
     overall_status = summary.get("overall_status", CheckStatus.PASS.value)
     issues_total = _coerce_int(summary.get("issues_total", 0), default=0)
     critical_issues = _coerce_int(summary.get("critical_issues", 0), default=0)
+    serialized_payload = _encode_payload(payload, max_bytes=MAX_REPORT_BYTES)
 
     async with get_async_session() as session:
         db_report = LinterReportDB(
-            generated_at=datetime.now(timezone.utc),
+            generated_at=datetime.now(_UTC),
             root_path=_normalize_root(payload.get("root_path")) or "",
             overall_status=overall_status,
             issues_total=issues_total,
             critical_issues=critical_issues,
-            payload=json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+            payload=serialized_payload,
         )
         session.add(db_report)
         await session.flush()
@@ -430,15 +478,13 @@ async def record_notification_async(
     """Almacena una notificación (async)."""
     await init_async_db()
     serialized_payload = (
-        json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-        if payload
-        else None
+        _encode_payload(payload, max_bytes=MAX_PAYLOAD_BYTES) if payload else None
     )
     normalized_root = _normalize_root(root_path)
 
     async with get_async_session() as session:
         notif = NotificationDB(
-            created_at=datetime.now(timezone.utc),
+            created_at=datetime.now(_UTC),
             channel=channel,
             severity=severity.value,
             title=title,
@@ -17,6 +17,7 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
+from .database_async import init_async_db
 from .scheduler import ChangeScheduler
 from .state import AppState
 from .settings import load_settings, save_settings
@@ -65,6 +66,8 @@ def create_app(root: Optional[str | Path] = None) -> FastAPI:
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
+        # Crear el esquema una sola vez; los accesos posteriores no reflejan tablas.
+        await init_async_db()
         await state.startup()
         try:
             yield
@@ -20,9 +20,10 @@ Para agregar una nueva característica, solo hay que añadir un handler a la lis
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 if TYPE_CHECKING:
@@ -39,6 +40,10 @@ class NotifyResult:
     skipped: int = 0
     errors: int = 0
     details: Optional[List[Dict[str, Any]]] = None
+    # Paths clasificados en paralelo a ``details`` para que los handlers
+    # no tengan que filtrar la lista de dicts en cada notificación.
+    processed_paths: List[str] = field(default_factory=list)
+    skipped_paths: List[str] = field(default_factory=list)
 
     def __post_init__(self) -> None:
         if self.details is None:
@@ -68,19 +73,9 @@ class SSEBroadcastHandler(ChangeHandler):
         return "sse_broadcast"
 
     async def handle(self, state: "AppState", result: NotifyResult) -> None:
-        if result.processed == 0:
-            return
-
-        # Extraer paths procesados
-        updated_paths = [
-            d["path"] for d in result.details if d.get("status") == "processed"
-        ]
+        updated_paths = result.processed_paths
         if updated_paths:
-            payload = {
-                "updated": updated_paths,
-                "deleted": [],
-            }
-            await state.event_queue.put(payload)
+            await state.event_queue.put({"updated": updated_paths, "deleted": []})
             logger.debug("SSE broadcast: %d files", len(updated_paths))
 
 
@@ -128,20 +123,26 @@ CHANGE_HANDLERS: List[ChangeHandler] = [
 
 async def run_all_handlers(state: "AppState", result: NotifyResult) -> List[str]:
     """
-    Ejecuta todos los handlers registrados.
+    Ejecuta todos los handlers registrados de forma concurrente.
+
+    Los handlers no dependen entre sí, así que un handler lento no bloquea
+    a los demás; el fallo de uno tampoco cancela al resto.
 
     Returns:
         Lista de nombres de handlers ejecutados.
     """
-    triggered: List[str] = []
+    handlers = list(CHANGE_HANDLERS)
+    outcomes = await asyncio.gather(
+        *(handler.handle(state, result) for handler in handlers),
+        return_exceptions=True,
+    )
 
-    for handler in CHANGE_HANDLERS:
-        try:
-            await handler.handle(state, result)
-            triggered.append(handler.name)
-            logger.debug("Handler '%s' executed successfully", handler.name)
-        except Exception as e:
-            logger.error("Handler '%s' failed: %s", handler.name, e)
-            # Continuar con los demás handlers
+    triggered: List[str] = []
+    for handler, outcome in zip(handlers, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("Handler '%s' failed: %s", handler.name, outcome)
+            continue
+        triggered.append(handler.name)
+        logger.debug("Handler '%s' executed successfully", handler.name)
 
     return triggered
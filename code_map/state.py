@@ -1039,6 +1039,7 @@ class AppState:
                     detail["status"] = "skipped"
                     detail["reason"] = f"Extension {abs_path.suffix} not supported"
                     result.skipped += 1
+                    result.skipped_paths.append(rel_path)
                     result.details.append(detail)
                     continue
 
@@ -1048,6 +1049,7 @@ class AppState:
                     detail["status"] = "skipped"
                     detail["reason"] = f"Unknown change type: {change_type}"
                     result.skipped += 1
+                    result.skipped_paths.append(rel_path)
                     result.details.append(detail)
                     continue
 
@@ -1060,6 +1062,7 @@ class AppState:
 
                 detail["status"] = "processed"
                 result.processed += 1
+                result.processed_paths.append(rel_path)
 
             except ValueError as e:
                 detail["status"] = "error"
@@ -705,6 +705,25 @@ def test_audit_run_flow(api_client: TestClient) -> None:
     assert closed_run["status"] == "closed"
 
 
+def test_audit_event_oversized_payload_rejected(api_client: TestClient) -> None:
+    from code_map.audit.storage import MAX_PAYLOAD_BYTES
+
+    run_id = api_client.post("/audit/runs", json={"name": "Big payload"}).json()[
+        "id"
+    ]
+
+    response = api_client.post(
+        f"/audit/runs/{run_id}/events",
+        json={
+            "type": "command",
+            "title": "Huge",
+            "payload": {"blob": "x" * (MAX_PAYLOAD_BYTES + 1)},
+        },
+    )
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+
+
 def test_linters_discovery_endpoint(api_client: TestClient) -> None:
     response = api_client.get("/linters/discovery")
     assert response.status_code == 200
@@ -433,3 +433,47 @@ class TestIntegrationScenarios:
             e for e in events if e.status == "ok" and "Recovery" in e.title
         ]
         assert len(success_events) >= 1
+
+
+class TestEventPayloadStorage:
+    """Tests for event payload handling in audit storage."""
+
+    def test_oversized_payload_rejected(self, test_run: AuditRun):
+        """Payloads above MAX_PAYLOAD_BYTES are rejected before persisting."""
+        from code_map.audit.storage import MAX_PAYLOAD_BYTES, append_event
+
+        with pytest.raises(ValueError):
+            append_event(
+                test_run.id,
+                type="test",
+                title="Huge payload",
+                payload={"blob": "x" * (MAX_PAYLOAD_BYTES + 1)},
+            )
+
+        events = list_events(test_run.id, limit=10)
+        assert all(e.title != "Huge payload" for e in events)
+
+    def test_payload_round_trips(self, test_run: AuditRun):
+        """Stored payloads are decoded back from the JSON column."""
+        from code_map.audit.storage import append_event
+
+        event = append_event(
+            test_run.id, type="test", title="Payload", payload={"key": "value"}
+        )
+
+        assert event.payload == {"key": "value"}
+        assert list_events(test_run.id, limit=10)[-1].payload == {"key": "value"}
+
+    def test_relative_root_follows_current_directory(self, tmp_path, monkeypatch):
+        """Relative roots are resolved against the cwd of each call."""
+        from code_map.audit.storage import _normalize_root
+
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        assert _normalize_root("") == first.resolve().as_posix()
+        monkeypatch.chdir(second)
+        assert _normalize_root("") == second.resolve().as_posix()
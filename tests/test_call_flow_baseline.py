@@ -408,6 +408,122 @@ class TestCppExtractorBaseline:
         # Should find class methods
         assert len(entries) >= 5  # At least free functions
 
+    @pytest.mark.skipif(
+        not Path(CPP_FIXTURE).exists(),
+        reason="C++ fixture file not found",
+    )
+    def test_list_entry_points_many_matches_single_file(self, extractor):
+        """Batch listing (serial and process pool) matches per-file listing."""
+        if not extractor.is_available():
+            pytest.skip("tree-sitter not available")
+
+        expected = extractor.list_entry_points(CPP_FIXTURE)
+        paths = [CPP_FIXTURE, CPP_FIXTURE]
+
+        serial = type(extractor).list_entry_points_many(paths, workers=1)
+        assert serial == {CPP_FIXTURE: expected}
+
+        parallel = type(extractor).list_entry_points_many(paths, workers=2)
+        assert parallel == {CPP_FIXTURE: expected}
+
+    def test_is_available_for_paths_without_cpp_files(self, extractor):
+        """Batches without C++ files never need the C++ parser."""
+        paths = [Path("app.py"), Path("index.ts")]
+
+        assert type(extractor).is_available_for_paths(paths) is False
+        assert type(extractor).list_entry_points_many(paths) == {
+            Path("app.py"): [],
+            Path("index.ts"): [],
+        }
+
+    def test_declaration_only_header_has_no_entry_points(self, extractor, tmp_path):
+        """Headers without function bodies yield no entry points."""
+        if not extractor.is_available():
+            pytest.skip("tree-sitter not available")
+
+        header = tmp_path / "api.hpp"
+        header.write_text("#pragma once\nint add(int a, int b);\nvoid reset();\n")
+
+        assert extractor.list_entry_points(header) == []
+
+    def test_mmap_parse_matches_bytes_parse(self, extractor, tmp_path, monkeypatch):
+        """Files above the mmap threshold list the same entry points."""
+        if not extractor.is_available():
+            pytest.skip("tree-sitter not available")
+        from code_map.graph_analysis.call_flow import cpp_extractor as module
+
+        body = "".join(
+            f"int helper_{i}(int x) {{ return helper_{i + 1}(x) + {i}; }}\n"
+            for i in range(6000)
+        )
+        source_file = tmp_path / "large.cpp"
+        source_file.write_text(body + "int main() { return helper_0(1); }\n")
+        assert source_file.stat().st_size > module.MMAP_THRESHOLD_BYTES
+
+        mapped = module.CppCallFlowExtractor(tree_cache_size=0).list_entry_points(
+            source_file
+        )
+        monkeypatch.setattr(module, "MMAP_THRESHOLD_BYTES", module.MAX_SOURCE_BYTES)
+        in_memory = module.CppCallFlowExtractor(
+            tree_cache_size=0
+        ).list_entry_points(source_file)
+
+        assert len(mapped) == 6001
+        assert mapped == in_memory
+
+    def test_unmappable_file_falls_back_to_reading(self, tmp_path, monkeypatch):
+        """A file truncated to 0 bytes after the size check is read instead."""
+        from code_map.graph_analysis.call_flow import cpp_extractor as module
+
+        source_file = tmp_path / "truncated.cpp"
+        source_file.write_bytes(b"")
+        # Route the empty file through the mmap branch, where mmap raises
+        # ValueError; no parse is needed since there is nothing to define
+        monkeypatch.setattr(module, "MMAP_THRESHOLD_BYTES", -1)
+        monkeypatch.setattr(module, "_PARSER_READY", True)
+
+        extractor = module.CppCallFlowExtractor(tree_cache_size=0)
+        assert extractor._map_source(source_file) is None
+        assert extractor.list_entry_points(source_file) == []
+
+    def test_defaulted_definitions_without_braces_are_listed(
+        self, extractor, tmp_path
+    ):
+        """`= default` / `= delete` definitions have no body but are listed."""
+        if not extractor.is_available():
+            pytest.skip("tree-sitter not available")
+
+        source_file = tmp_path / "widget.cpp"
+        source_file.write_text(
+            '#include "widget.hpp"\nWidget::Widget() = default;\n'
+            "void legacy() = delete;\n"
+        )
+
+        names = [e["qualified_name"] for e in extractor.list_entry_points(source_file)]
+        assert names == ["Widget::Widget", "legacy"]
+
+    def test_tree_cache_checks_out_entries_by_resolved_path(
+        self, tmp_path, monkeypatch
+    ):
+        """Cached trees are keyed by resolved path and lent to one caller."""
+        from code_map.graph_analysis.call_flow import cpp_extractor as module
+
+        source_file = tmp_path / "main.cpp"
+        source_file.write_text("int main() { return 0; }\n")
+        stat = source_file.stat()
+        extractor = module.CppCallFlowExtractor()
+        monkeypatch.chdir(tmp_path)
+
+        extractor._cache_tree(Path("main.cpp"), stat, b"src", "tree")
+        assert extractor._get_cached_tree(source_file, stat) == (b"src", "tree")
+        # Checked out: a concurrent caller must parse its own tree
+        assert extractor._get_cached_tree(source_file, stat) is None
+
+        big = b"x" * (module.MMAP_THRESHOLD_BYTES + 1)
+        extractor._cache_tree(source_file, stat, big, "tree")
+        assert extractor._get_cached_tree(source_file, stat) is None
+        assert extractor._tree_cache_bytes == 0
+
 
 # ============================================================================
 # Cross-Extractor Consistency Tests
@@ -467,6 +583,23 @@ class TestExtractorConsistency:
         ), f"CallEdge missing 'source_id', has: {edge_fields}"
         assert "target_id" in edge_fields
 
+    def test_react_flow_json_matches_payload(self):
+        """Serialized React Flow JSON decodes to the to_react_flow payload."""
+        from code_map.graph_analysis.call_flow.models import (
+            CallEdge,
+            CallGraph,
+            CallNode,
+        )
+
+        graph = CallGraph(entry_point="a", source_file=Path("main.py"))
+        graph.add_node(
+            CallNode(id="a", name="a", qualified_name="a", file_path=Path("main.py"))
+        )
+        graph.add_node(CallNode(id="b", name="b", qualified_name="b", depth=1))
+        graph.add_edge(CallEdge(source_id="a", target_id="b", call_site_line=3))
+
+        assert json.loads(graph.to_react_flow_json()) == graph.to_react_flow()
+
 
 # ============================================================================
 # Snapshot Tests (for detailed regression testing)
@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 from sqlmodel import Session, select
 
-from code_map.database import get_engine, init_db
+from code_map.database import get_engine, init_db, reset_db_initialized
 from code_map.models import AppSettingsDB
 from code_map.settings import AppSettings, _save_settings_to_db, _load_settings_from_db
 
@@ -43,6 +43,33 @@ def test_init_db(engine):
         assert "notifications" in table_names
 
 
+def test_init_db_recreates_deleted_database(engine, db_path: Path):
+    """A database file deleted after init_db gets its schema again."""
+    from sqlalchemy import inspect
+
+    engine.dispose()
+    db_path.unlink()
+
+    init_db(engine)
+    assert "app_settings" in inspect(engine).get_table_names()
+
+
+def test_reset_db_initialized_reruns_create_all(engine, monkeypatch):
+    """After a reset, init_db runs create_all again for a known URL."""
+    from sqlmodel import SQLModel
+
+    calls = []
+    monkeypatch.setattr(
+        SQLModel.metadata, "create_all", lambda bind: calls.append(bind)
+    )
+
+    init_db(engine)
+    assert calls == []
+    reset_db_initialized()
+    init_db(engine)
+    assert calls == [engine]
+
+
 def test_save_and_load_settings(db_path: Path):
     """Test saving and loading settings via the settings module helpers."""
 